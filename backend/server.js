@@ -6,6 +6,7 @@ const path = require('path');
 const fs = require('fs');
 const crypto = require('crypto');
 require('dotenv').config();
+const { version } = require('./package.json');
 
 const app = express();
 const PORT = process.env.PORT || 3001;
@@ -382,6 +383,7 @@ app.get('/api/stats', async (req, res) => {
 app.get('/api/health', (req, res) => {
   res.json({ 
     status: 'ok', 
+    version,
     timestamp: new Date().toISOString(),
     ipfsConnected: !!ipfs
   });